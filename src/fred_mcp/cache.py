@@ -0,0 +1,177 @@
+import os
+import json
+import time
+import pickle
+import hashlib
+import inspect
+import threading
+import functools
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+DAY = 24 * 60 * 60
+
+# Entries kept in process memory in front of the disk cache.
+MEMORY_MAXSIZE = 512
+
+def default_cache_dir() -> Optional[str]:
+    """
+    Cache root, overridable with the FRED_MCP_CACHE_DIR environment variable.
+
+    Setting the variable to an empty string returns None, which turns caching off.
+    """
+    root = os.environ.get("FRED_MCP_CACHE_DIR")
+    if root is None:
+        return os.path.join(os.path.expanduser("~"), ".cache", "fred-mcp")
+    return root or None
+
+class FileCache:
+    """
+    TTL cache that pickles values to disk.
+
+    A key of the form `<endpoint>/<digest>` is stored as `<root>/<endpoint>/<digest>.pkl`,
+    next to a `<digest>.meta.json` file recording when it was written and when it expires.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _paths(self, key: str) -> tuple:
+        base = os.path.join(self.root, *key.split("/"))
+        return base + ".pkl", base + ".meta.json"
+
+    def get_entry(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Return `(value, expires_at)` for `key`, or None if it is missing or expired.
+
+        Expired and unreadable entries are deleted, so the next call refetches.
+        """
+        data_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            if meta["expires_at"] < time.time():
+                self._remove(key)
+                return None
+            with open(data_path, 'rb') as f:
+                return pickle.load(f), meta["expires_at"]
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Besides corrupt files, unpickling fails when the entry was written by a
+            # different environment (e.g. pyarrow-backed pandas columns read without
+            # pyarrow installed). Like writes, reads are best-effort.
+            self._remove(key)
+            return None
+
+    def _remove(self, key: str) -> None:
+        """Delete the files of `key`, ignoring any that are already gone."""
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store `value` under `key` for `ttl` seconds."""
+        data_path, meta_path = self._paths(key)
+        now = time.time()
+        try:
+            os.makedirs(os.path.dirname(data_path), exist_ok=True)
+            # Write to per-thread temp files and rename, so concurrent readers and
+            # writers never see partial files.
+            suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(data_path + suffix, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(data_path + suffix, data_path)
+            with open(meta_path + suffix, 'w') as f:
+                json.dump({"key": key, "created_at": now, "expires_at": now + ttl}, f)
+            os.replace(meta_path + suffix, meta_path)
+        except OSError:
+            # Caching is best-effort; a read-only or full disk must not fail the request.
+            pass
+
+class MemoryCache:
+    """
+    Bounded in-process TTL cache, consulted before `FileCache`.
+
+    Saves the unpickle on repeat calls within one server session. The least
+    recently used entry is evicted once `maxsize` is reached. Values are handed
+    out as-is, so callers must not mutate them.
+    """
+
+    def __init__(self, maxsize: int = MEMORY_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        # Tools fetch from worker threads, so access is serialized.
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for `key`, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, expires_at: float) -> None:
+        """Store `value` under `key` until the `expires_at` timestamp."""
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+_cache_root = default_cache_dir()
+# None when caching is turned off; `cached` then calls straight through.
+_cache: Optional[FileCache] = FileCache(_cache_root) if _cache_root else None
+_memory = MemoryCache()
+
+def make_key(endpoint: str, params: dict) -> str:
+    """Build a cache key from the endpoint name and its (sorted) call parameters."""
+    payload = json.dumps(params, sort_keys=True, default=str)
+    return f"{endpoint}/{hashlib.md5(payload.encode('utf-8')).hexdigest()}"
+
+def cached(ttl_days: float) -> Callable:
+    """
+    Cache a client method's return value for `ttl_days`, in memory and on disk.
+
+    Arguments are bound to the method signature first, so positional and keyword
+    calls share an entry. None results are never cached. A value loaded from disk
+    is kept in memory only until its disk entry expires. Does nothing when caching
+    is turned off (see `default_cache_dir`).
+    """
+    def decorator(fn: Callable) -> Callable:
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            if _cache is None:
+                return fn(self, *args, **kwargs)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {k: v for k, v in bound.arguments.items() if k != "self"}
+            key = make_key(fn.__name__, params)
+
+            value = _memory.get(key)
+            if value is not None:
+                return value
+
+            entry = _cache.get_entry(key)
+            if entry is not None:
+                value, expires_at = entry
+            else:
+                value = fn(self, *args, **kwargs)
+                if value is None:
+                    return None
+                expires_at = time.time() + ttl_days * DAY
+                _cache.set(key, value, ttl_days * DAY)
+            _memory.set(key, value, expires_at)
+            return value
+        return wrapper
+    return decorator
@@ -0,0 +1,176 @@
+import xml.etree.ElementTree as ET
+from urllib.parse import quote_plus, urlencode
+import numpy as np
+import orjson
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from fredapi import Fred
+from .cache import cached
+
+# Observations and search hits change with each data release; series metadata
+# and category membership change rarely.
+SERIES_TTL_DAYS = 1
+METADATA_TTL_DAYS = 30
+
+class PooledFred(Fred):
+    """
+    `Fred` client that fetches through a shared, keep-alive `requests.Session`.
+
+    fredapi opens a fresh `urlopen` connection for every request, paying a TCP
+    connect and TLS handshake each time. Routing its fetch helper through a
+    pooled session lets consecutive tool calls reuse the same connection.
+    """
+
+    def __init__(self, api_key: str, pool_size: int = 10, timeout: float = 30.0):
+        super().__init__(api_key=api_key)
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        if self.proxies:
+            self.session.proxies.update(self.proxies)
+
+    # Overrides fredapi's name-mangled `Fred.__fetch_data`, which every
+    # public method funnels through.
+    def _Fred__fetch_data(self, url: str) -> ET.Element:
+        """Fetch `url` over the pooled session and parse the XML response."""
+        url += '&api_key=' + self.api_key
+        response = self.session.get(url, timeout=self.timeout)
+        if not response.ok:
+            try:
+                message = ET.fromstring(response.content).get('message')
+            except ET.ParseError:
+                response.raise_for_status()
+            raise ValueError(message)
+        return ET.fromstring(response.content)
+
+    def _fetch_json(self, url: str) -> dict:
+        """Fetch `url` as FRED JSON (`file_type=json`) over the pooled session and parse it with orjson."""
+        url += '&file_type=json&api_key=' + self.api_key
+        response = self.session.get(url, timeout=self.timeout)
+        if not response.ok:
+            try:
+                message = orjson.loads(response.content).get('error_message')
+            except (orjson.JSONDecodeError, AttributeError):
+                response.raise_for_status()
+            raise ValueError(message)
+        return orjson.loads(response.content)
+
+    @cached(ttl_days=SERIES_TTL_DAYS)
+    def get_series(self, series_id, observation_start=None, observation_end=None, **kwargs):
+        """
+        Same result as `Fred.get_series`, built from FRED's JSON output.
+
+        fredapi parses the XML response and calls `pd.to_datetime` once per
+        observation; here the dates and values are converted in one vectorized
+        pass each, which is much faster for long daily series.
+        """
+        url = f"{self.root_url}/series/observations?series_id={series_id}"
+        if observation_start is not None:
+            url += '&observation_start=' + pd.to_datetime(observation_start, errors='raise').strftime('%Y-%m-%d')
+        if observation_end is not None:
+            url += '&observation_end=' + pd.to_datetime(observation_end, errors='raise').strftime('%Y-%m-%d')
+        if kwargs:
+            url += '&' + urlencode(kwargs)
+        observations = self._fetch_json(url).get('observations', [])
+        dates = pd.to_datetime([obs['date'] for obs in observations], format='%Y-%m-%d')
+        values = np.array(
+            [np.nan if obs['value'] == self.nan_char else obs['value'] for obs in observations], dtype=float
+        )
+        return pd.Series(values, index=dates)
+
+    @cached(ttl_days=METADATA_TTL_DAYS)
+    def get_series_info(self, series_id):
+        return super().get_series_info(series_id)
+
+    @cached(ttl_days=SERIES_TTL_DAYS)
+    def search(self, text, limit=1000, order_by=None, sort_order=None, filter=None):
+        return super().search(text, limit=limit, order_by=order_by, sort_order=sort_order, filter=filter)
+
+    @cached(ttl_days=METADATA_TTL_DAYS)
+    def search_by_category(self, category_id, limit=0, order_by=None, sort_order=None, filter=None):
+        return super().search_by_category(category_id, limit=limit, order_by=order_by, sort_order=sort_order, filter=filter)
+
+    def _series_page(self, url: str, limit: int, offset: int, order_by=None, sort_order=None) -> tuple:
+        """
+        Fetch one page of a series-list endpoint, letting FRED apply `limit`/`offset`.
+
+        fredapi's search helpers always download 1000 rows and truncate locally.
+        Returns `(df, total_count)`, where `df` is None for an empty page.
+        """
+        url += f"&limit={min(limit, self.max_results_per_request)}&offset={offset}"
+        if order_by is not None:
+            url += f"&order_by={order_by}"
+        if sort_order is not None:
+            url += f"&sort_order={sort_order}"
+        return self._Fred__do_series_search(url)
+
+    @cached(ttl_days=SERIES_TTL_DAYS)
+    def search_page(self, text, limit=10, offset=0, order_by=None, sort_order=None):
+        url = f"{self.root_url}/series/search?search_text={quote_plus(text)}"
+        return self._series_page(url, limit, offset, order_by, sort_order)
+
+    @cached(ttl_days=METADATA_TTL_DAYS)
+    def category_series_page(self, category_id, limit=1000, offset=0, order_by=None, sort_order=None):
+        url = f"{self.root_url}/category/series?category_id={category_id}"
+        return self._series_page(url, limit, offset, order_by, sort_order)
+
+    # fredapi has no wrappers for the release and source endpoints, so they are
+    # fetched directly and each returned element becomes one row.
+
+    def _fetch_list(self, path: str, **params) -> tuple:
+        """
+        Fetch a FRED list endpoint; returns `(df, total_count)`.
+
+        Each child element's attributes become one row. `total_count` is the `count`
+        FRED reports for the whole list, not just the rows returned.
+        """
+        query = urlencode({k: v for k, v in params.items() if v is not None})
+        root = self._Fred__fetch_data(f"{self.root_url}/{path}?{query}")
+        rows = [child.attrib for child in root]
+        return pd.DataFrame(rows), int(root.get('count', len(rows)))
+
+    def _fetch_records(self, path: str, **params) -> pd.DataFrame:
+        """Fetch a FRED list endpoint and return the attributes of its child elements as rows."""
+        return self._fetch_list(path, **params)[0]
+
+    def _fetch_all_records(self, path: str, **params) -> pd.DataFrame:
+        """
+        Fetch every row of a paginated FRED list endpoint, `max_results_per_request` rows at a time.
+
+        Pages are requested until the `count` reported by FRED is reached or a short page comes back.
+        """
+        limit = self.max_results_per_request
+        frames, offset = [], 0
+        while True:
+            df, total_count = self._fetch_list(path, **params, limit=limit, offset=offset)
+            frames.append(df)
+            offset += len(df)
+            if len(df) < limit or offset >= total_count:
+                break
+        return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+    @cached(ttl_days=METADATA_TTL_DAYS)
+    def get_all_releases(self):
+        return self._fetch_all_records("releases")
+
+    @cached(ttl_days=METADATA_TTL_DAYS)
+    def get_all_release_series(self, release_id):
+        return self._fetch_all_records("release/series", release_id=release_id)
+
+    @cached(ttl_days=METADATA_TTL_DAYS)
+    def releases_page(self, limit=1000, offset=0):
+        return self._fetch_list("releases", limit=limit, offset=offset)
+
+    @cached(ttl_days=METADATA_TTL_DAYS)
+    def release_series_page(self, release_id, limit=1000, offset=0):
+        return self._fetch_list("release/series", release_id=release_id, limit=limit, offset=offset)
+
+    @cached(ttl_days=METADATA_TTL_DAYS)
+    def get_sources(self):
+        return self._fetch_records("sources")
+
+    @cached(ttl_days=METADATA_TTL_DAYS)
+    def get_source(self, source_id):
+        return self._fetch_records("source", source_id=source_id).to_dict(orient='records')
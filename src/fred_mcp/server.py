@@ -1,71 +1,385 @@
+from __future__ import annotations
+
+import io
 import os
-import json
-import pandas as pd
-from typing import Optional, Union, Any, Dict, List
-from fredapi import Fred
+import asyncio
+import inspect
+import logging
+import functools
+from typing import TYPE_CHECKING, Optional, Union, Any, Dict, Iterator, List, Tuple
 from mcp.server.fastmcp import FastMCP
 from mcp.types import CallToolResult, TextContent
 
+# pandas, numpy and fredapi (with requests) add a few hundred ms to process
+# startup, so they are imported where first used instead. Python caches the
+# module after the first import, so later calls pay only a dict lookup.
+if TYPE_CHECKING:
+    import pandas as pd
+    from fredapi import Fred
+
 # Initialize FastMCP
 mcp = FastMCP("fred-mcp-server")
+logger = logging.getLogger(__name__)
+
+# Markdown previews show at most this many rows; structuredContent still carries
+# the full limit/offset window.
+PREVIEW_ROW_CAP = 50
+
+# Columns shown in search_series previews unless the caller asks for others.
+DEFAULT_SEARCH_FIELDS = ['id', 'title', 'observation_start', 'observation_end', 'frequency_short', 'units_short', 'popularity']
+
+# Failures a tool is expected to hit: network and file errors (requests'
+# RequestException and TimeoutError are OSErrors), FRED rejecting a request or
+# returning no data (ValueError), and missing response fields (KeyError).
+_EXPECTED_ERRORS = (OSError, ValueError, KeyError)
+
+def _tool(action: Optional[str] = None):
+    """
+    Decorator that turns expected exceptions raised by a tool into an error result.
+
+    The client sees "Error {action}: {exception}" with `isError` set; the traceback
+    goes to the server log. Anything outside `_EXPECTED_ERRORS` is a bug and
+    propagates to FastMCP's own handler. Apply it beneath `@mcp.tool()`.
+    """
+    prefix = f"Error {action}" if action else "Error"
+
+    def decorator(fn):
+        def error_result(e: Exception) -> CallToolResult:
+            logger.exception("Tool %s failed", fn.__name__)
+            return CallToolResult(
+                content=[TextContent(type="text", text=f"{prefix}: {str(e)}")],
+                isError=True,
+                structuredContent={"error": str(e)}
+            )
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await fn(*args, **kwargs)
+                except _EXPECTED_ERRORS as e:
+                    return error_result(e)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                try:
+                    return fn(*args, **kwargs)
+                except _EXPECTED_ERRORS as e:
+                    return error_result(e)
+        return wrapper
+    return decorator
 
 def get_fred() -> Fred:
     """Helper to get authenticated Fred instance."""
     api_key = os.environ.get("FRED_API_KEY")
     if not api_key:
         raise ValueError("FRED_API_KEY environment variable not set. Please set it to use this server.")
-    return Fred(api_key=api_key)
+    return _fred_for_key(api_key)
+
+@functools.lru_cache(maxsize=1)
+def _fred_for_key(api_key: str) -> Fred:
+    """Build the shared client once per API key so HTTP connections are reused across tool calls."""
+    from .client import PooledFred
+    return PooledFred(api_key=api_key)
+
+@functools.lru_cache(maxsize=512)
+def _series_header(series_id: str) -> str:
+    """Markdown title for a series preview. Failures are not cached, so callers fall back per call."""
+    info = get_fred().get_series_info(series_id)
+    title = info.get('title', series_id)
+    units = info.get('units', '')
+    return f"## {title} ({units})"
+
+def _iso_dates(values: Any) -> Any:
+    """
+    Format datetime64 values (array, Series or DatetimeIndex) as YYYY-MM-DD strings.
+
+    Uses numpy's C date formatter in one pass instead of per-element `strftime`.
+    """
+    import numpy as np
+
+    return np.datetime_as_string(np.asarray(values), unit='D')
+
+def _series_to_records_fast(series: pd.Series) -> List[Dict[str, Any]]:
+    """
+    `df_to_records` for a date-indexed observation series, zipped straight from its arrays.
+
+    Skips the DataFrame round trip (`to_frame`, `reset_index`, `to_dict`). Missing
+    values become None so they serialize as JSON null.
+    """
+    date_key = series.index.name or "date"
+    dates = _iso_dates(series.index).tolist()
+    values = series.tolist()
+    # `v != v` is the NaN check, without a per-element function call.
+    return [{date_key: d, "value": None if v != v else v} for d, v in zip(dates, values)]
+
+def _json_columns(df: Union[pd.DataFrame, pd.Series]) -> Tuple[List[str], List[List[Any]]]:
+    """
+    Shared conversion behind `df_to_records` and `df_to_columns`: column names and per-column value lists.
+
+    Dates become YYYY-MM-DD strings (via `_export_frame`) and missing values None,
+    so both structuredContent layouts encode the same data the same way.
+    """
+    frame = _export_frame(df)
+    names = [str(name) for name in frame.columns]
+    # `v != v` is the NaN check, as in `_series_to_records_fast`.
+    values = [[None if v != v else v for v in frame.iloc[:, i].tolist()] for i in range(len(names))]
+    return names, values
 
 def df_to_records(df: pd.DataFrame) -> List[Dict[str, Any]]:
     """Helper to convert DataFrame to JSON-serializable records."""
+    import pandas as pd
+
     if df is None or df.empty:
         return []
-    
-    # Prepare for JSON export
-    temp_df = df.copy()
-    if isinstance(temp_df, pd.Series):
-        temp_df = temp_df.to_frame(name="value")
-    
-    # Handle dates if they are in the index
-    if isinstance(temp_df.index, pd.DatetimeIndex):
-        temp_df.index.name = temp_df.index.name or "date"
-        temp_df.reset_index(inplace=True)
-        # Convert timestamp to string for JSON serialization
-        for col in temp_df.select_dtypes(include=['datetime64']).columns:
-            temp_df[col] = temp_df[col].dt.strftime('%Y-%m-%d')
-    
-    # Convert other objects that might not be serializable
-    # (e.g., float('nan') which common JSON encoders handle, but we can be explicit)
-    return temp_df.to_dict(orient='records')
+    if isinstance(df, pd.Series) and isinstance(df.index, pd.DatetimeIndex):
+        return _series_to_records_fast(df)
+    names, values = _json_columns(df)
+    return [dict(zip(names, row)) for row in zip(*values)]
+
+def df_to_columns(df: pd.DataFrame) -> Dict[str, List[Any]]:
+    """
+    Column-oriented counterpart of `df_to_records`: one list of values per column.
 
-def format_series_search_results(df: pd.DataFrame, limit: int, offset: int) -> str:
-    """Format search results as Markdown table."""
+    Avoids building a dict per row, which keeps large payloads small and quick to
+    serialize. Values go through the same conversion as the records layout.
+    """
     if df is None or df.empty:
-        return "No series found."
-    
-    # Apply pagination
-    total_count = len(df)
-    df_page = df.iloc[offset : offset + limit]
-    
-    markdown = f"**Found {total_count} series (showing {len(df_page)}):**\n\n"
-    markdown += df_page.to_markdown(index=False)
-    return markdown
-
-def save_to_file(data: pd.DataFrame, file_path: str, series_id: Optional[str] = None) -> str:
-    """Helper to save DataFrame to JSON and return a confirmation message."""
-    # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
-    
-    records = df_to_records(data)
+        return {}
+    names, values = _json_columns(df)
+    return dict(zip(names, values))
+
+def _structured_rows(df: pd.DataFrame, format: str) -> Any:
+    """Convert a preview page for structuredContent in the requested `format` ("records" or "columnar")."""
+    if format == "records":
+        return df_to_records(df)
+    if format == "columnar":
+        return df_to_columns(df)
+    raise ValueError(f"Unknown format {format!r}; expected 'records' or 'columnar'")
+
+def _fast_to_markdown(df: Union[pd.DataFrame, pd.Series], index: bool = False, buf: Optional[io.StringIO] = None) -> str:
+    """
+    Render a DataFrame (or Series) as a pipe-style Markdown table.
+
+    Replaces `to_markdown()`, whose tabulate backend stringifies and measures every
+    cell in a Python loop. Here each column is converted and measured in one
+    vectorized numpy pass. Numeric columns are right-aligned, others left-aligned.
+
+    The table is appended to `buf` when given (so callers can write their heading
+    into the same buffer first); the buffer's full contents are returned.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(df, pd.Series):
+        df = df.to_frame(name=df.name if df.name is not None else "value")
+    if index:
+        default_name = "date" if isinstance(df.index, pd.DatetimeIndex) else "index"
+        df = df.reset_index(names=df.index.name or default_name)
+
+    headers, separators, columns = [], [], []
+    for i, name in enumerate(df.columns):
+        col = df.iloc[:, i]
+        text = col.astype(str).to_numpy(dtype=str)
+        header = str(name)
+        width = max(len(header), int(np.char.str_len(text).max()) if len(text) else 0)
+        if pd.api.types.is_numeric_dtype(col.dtype) and not pd.api.types.is_bool_dtype(col.dtype):
+            headers.append(header.rjust(width))
+            separators.append("-" * (width + 1) + ":")
+            columns.append(np.char.rjust(text, width) if len(text) else text)
+        else:
+            headers.append(header.ljust(width))
+            separators.append(":" + "-" * (width + 1))
+            columns.append(np.char.ljust(text, width) if len(text) else text)
+
+    if buf is None:
+        buf = io.StringIO()
+    buf.write("| " + " | ".join(headers) + " |\n")
+    buf.write("|" + "|".join(separators) + "|")
+    # Zipping plain lists of str is ~3x faster than iterating numpy string scalars.
+    buf.write("".join("\n| " + " | ".join(row) + " |" for row in zip(*(c.tolist() for c in columns))))
+    return buf.getvalue()
+
+def _series_to_markdown(series: pd.Series, buf: Optional[io.StringIO] = None) -> str:
+    """
+    Render a date-indexed observation series as a `date | value` Markdown table.
+
+    Specialization of `_fast_to_markdown` for `get_series` results: the shape is
+    fixed, so rows are formatted straight from the index and value arrays without
+    building an intermediate DataFrame.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if not isinstance(series.index, pd.DatetimeIndex):
+        return _fast_to_markdown(series, index=True, buf=buf)
+    if buf is None:
+        buf = io.StringIO()
+
+    dates = _iso_dates(series.index)
+    # str() on the unboxed floats matches astype(str) output but skips pandas' object-dtype machinery.
+    values = np.array(list(map(str, series.tolist())), dtype=str)
+    date_width = max(len("date"), int(np.char.str_len(dates).max()) if len(dates) else 0)
+    value_width = max(len("value"), int(np.char.str_len(values).max()) if len(values) else 0)
+
+    buf.write(f"| {'date'.ljust(date_width)} | {'value'.rjust(value_width)} |\n")
+    buf.write(f"|:{'-' * (date_width + 1)}|{'-' * (value_width + 1)}:|")
+    if len(series):
+        # Assemble every row with vectorized string concatenation, then join once.
+        rows = np.char.add(
+            np.char.add("\n| ", np.char.ljust(dates, date_width)),
+            np.char.add(" | ", np.char.add(np.char.rjust(values, value_width), " |")),
+        )
+        buf.write("".join(rows.tolist()))
+    return buf.getvalue()
+
+def _preview_cap_note(rows: int) -> str:
+    """Markdown note for a preview table truncated to `PREVIEW_ROW_CAP` rows, or "" if it fits."""
+    if rows <= PREVIEW_ROW_CAP:
+        return ""
+    return f"*Table capped at {PREVIEW_ROW_CAP} of {rows} rows; all rows are in the structured results, or use file_path to save everything.*\n\n"
+
+def format_series_search_results(df_page: pd.DataFrame, total_count: int, noun: str = "series") -> str:
+    """Format an already-paginated page of search results as Markdown table; `noun` names the rows."""
+    if df_page is None or df_page.empty:
+        return f"No {noun} found."
     
-    with open(file_path, 'w') as f:
-        json.dump(records, f, indent=2)
-        
+    buf = io.StringIO()
+    buf.write(f"**Found {total_count} {noun} (showing {len(df_page)}):**\n\n")
+    buf.write(_preview_cap_note(len(df_page)))
+    return _fast_to_markdown(df_page.head(PREVIEW_ROW_CAP), buf=buf)
+
+# Export directories already created by `save_to_file`.
+_ENSURED_DIRS: set = set()
+
+def _export_frame(data: Union[pd.DataFrame, pd.Series], dates_as_strings: bool = True) -> pd.DataFrame:
+    """
+    Flatten data into the flat record layout written by `save_to_file`.
+
+    Dates become YYYY-MM-DD strings unless `dates_as_strings` is False (for formats
+    with a native date type). `data` itself is left untouched. None (fredapi's
+    result for an empty search) becomes an empty frame.
+    """
+    import pandas as pd
+
+    if data is None:
+        frame = pd.DataFrame()
+    elif isinstance(data, pd.Series):
+        frame = data.to_frame(name="value")
+    else:
+        # Client results are shared through the in-memory cache. A shallow copy
+        # lets date columns be replaced without touching the cached frame or
+        # copying the other columns.
+        frame = data.copy(deep=False)
+    if isinstance(frame.index, pd.DatetimeIndex):
+        frame = frame.reset_index(names=frame.index.name or "date")
+    if dates_as_strings:
+        for col in frame.select_dtypes(include=['datetime64']).columns:
+            frame[col] = _iso_dates(frame[col])
+    return frame
+
+def _iter_records(frame: pd.DataFrame) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the rows of an `_export_frame` result as dicts, for the JSON writers.
+
+    Rows are zipped from per-column `tolist()` values, which skips `to_dict`'s
+    per-cell boxing.
+    """
+    columns = [str(c) for c in frame.columns]
+    values = [frame.iloc[:, i].tolist() for i in range(len(columns))]
+    for row in zip(*values):
+        yield dict(zip(columns, row))
+
+def _dump_json(obj: Any, option: Optional[int] = None) -> bytes:
+    """
+    orjson encoding shared by the JSON writers.
+
+    Unlike `DataFrame.to_json`, floats keep full precision instead of being rounded
+    to 10 significant digits, and NaN is written as null. Values orjson cannot
+    encode natively (e.g. tz-aware timestamps) fall back to `str()`.
+    """
+    import orjson
+
+    return orjson.dumps(obj, default=str, option=option)
+
+def _records_json(frame: pd.DataFrame, pretty: bool = False) -> bytes:
+    """Encode a frame as a JSON array of records, indented if `pretty`."""
+    import orjson
+
+    return _dump_json(list(_iter_records(frame)), orjson.OPT_INDENT_2 if pretty else None)
+
+def _write_json_lines(frame: pd.DataFrame, f: Any) -> None:
+    """
+    Write a frame to `f` as JSON Lines, one record per row.
+
+    Rows are encoded and written one at a time, so no list of records is built.
+    """
+    import orjson
+
+    f.writelines(_dump_json(record, orjson.OPT_APPEND_NEWLINE) for record in _iter_records(frame))
+
+def _write_export(data: pd.DataFrame, file_path: str, pretty: bool) -> pd.DataFrame:
+    """Write `data` to `file_path` in the format its extension selects; returns the frame written."""
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.parquet':
+        frame = _export_frame(data, dates_as_strings=False)
+        try:
+            frame.to_parquet(file_path, engine='pyarrow', compression='zstd', index=False)
+        except ImportError:
+            raise ValueError("Saving .parquet files requires pyarrow: pip install 'fred-data-mcp[parquet]'")
+    elif extension == '.feather':
+        frame = _export_frame(data, dates_as_strings=False)
+        try:
+            # Feather stores no index, and rejects anything but a default RangeIndex.
+            frame.reset_index(drop=True).to_feather(file_path)
+        except ImportError:
+            raise ValueError("Saving .feather files requires pyarrow: pip install 'fred-data-mcp[parquet]'")
+    elif extension == '.csv':
+        frame = _export_frame(data, dates_as_strings=False)
+        frame.to_csv(file_path, index=False)
+    elif extension in ('.jsonl', '.ndjson'):
+        frame = _export_frame(data)
+        with open(file_path, 'wb') as f:
+            _write_json_lines(frame, f)
+    else:
+        frame = _export_frame(data)
+        with open(file_path, 'wb') as f:
+            f.write(_records_json(frame, pretty=pretty))
+    return frame
+
+def save_to_file(data: pd.DataFrame, file_path: str, series_id: Optional[str] = None, *, pretty: bool = False) -> Tuple[str, int]:
+    """
+    Helper to save DataFrame to a file; returns a confirmation message and the number of records written.
+
+    The format follows the extension: `.parquet` (zstd-compressed) or `.feather`
+    (both need pyarrow), `.csv`, `.jsonl`/`.ndjson` (one JSON record per line), or
+    a JSON array of records for anything else, compact unless `pretty` is set.
+    """
+    # Create directory if it doesn't exist (once per directory per process).
+    # Keyed on the path as given, so repeat exports skip abspath() as well.
+    directory = os.path.dirname(file_path)
+    if directory not in _ENSURED_DIRS:
+        os.makedirs(os.path.abspath(directory), exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+
+    try:
+        frame = _write_export(data, file_path, pretty)
+    except OSError:
+        # The directory may have been removed after it was remembered (pandas reports
+        # that as a plain OSError); recreate it and retry once.
+        if os.path.isdir(os.path.abspath(directory)):
+            raise
+        _ENSURED_DIRS.discard(directory)
+        os.makedirs(os.path.abspath(directory), exist_ok=True)
+        _ENSURED_DIRS.add(directory)
+        frame = _write_export(data, file_path, pretty)
+
     id_str = f" for `{series_id}`" if series_id else ""
-    return f"✅ Data{id_str} saved to `{file_path}` ({len(records)} records)\n"
+    return f"✅ Data{id_str} saved to `{file_path}` ({len(frame)} records)\n", len(frame)
 
 @mcp.tool()
-def search_series(query: str, limit: int = 10, offset: int = 0, file_path: Optional[str] = None) -> CallToolResult:
+@_tool("searching series")
+async def search_series(query: str, limit: int = 10, offset: int = 0, file_path: Optional[str] = None, pretty: bool = False, format: str = "records", fields: Optional[str] = None) -> CallToolResult:
     """
     Search for economic data series by text query.
     
@@ -74,133 +388,133 @@ def search_series(query: str, limit: int = 10, offset: int = 0, file_path: Optio
         limit: Maximum number of results to return in preview (default: 10).
         offset: Number of results to skip (default: 0).
         file_path: Optional absolute path to save the full search results as JSON.
+                   Use a `.csv`, `.jsonl`, `.parquet` or `.feather` extension to write that format instead.
+        pretty: Indent a saved JSON file for reading; it is written compactly by default.
+        format: Layout of the structured results: "records" (a list of row objects, default)
+                or "columnar" (one list of values per column, more compact for large pages).
+        fields: Comma-separated columns to include in the preview (e.g. "id,title,notes"), or "*"
+                for all of them. Defaults to id, title, observation dates, frequency, units and
+                popularity. A saved file always has every column.
     """
-    try:
-        fred = get_fred()
-        df = fred.search(query)
-        
-        records = df_to_records(df)
-        
-        if file_path:
-            msg = save_to_file(df, file_path, query)
-            return CallToolResult(
-                content=[TextContent(type="text", text=msg)],
-                structuredContent={"message": msg, "file_path": file_path, "count": len(records)}
-            )
-            
-        markdown = format_series_search_results(df, limit, offset)
+    fred = get_fred()
+    if file_path:
+        # limit=0 makes fredapi page through every match instead of stopping at 1000.
+        df = await asyncio.to_thread(fred.search, query, limit=0)
+        msg, count = await asyncio.to_thread(save_to_file, df, file_path, query, pretty=pretty)
         return CallToolResult(
-            content=[TextContent(type="text", text=markdown)],
-            structuredContent={"results": records}
-        )
-    except Exception as e:
-        error_msg = f"Error searching series: {str(e)}"
-        return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True,
-            structuredContent={"error": str(e)}
+            content=[TextContent(type="text", text=msg)],
+            structuredContent={"message": msg, "file_path": file_path, "count": count}
         )
+        
+    # Only the requested page is downloaded and parsed
+    df, total_count = await asyncio.to_thread(fred.search_page, query, limit=limit, offset=offset)
+    if df is not None and fields != "*":
+        wanted = [f.strip() for f in fields.split(",")] if fields else DEFAULT_SEARCH_FIELDS
+        columns = [c for c in wanted if c in df.columns]
+        if not columns:
+            raise ValueError(f"None of the requested fields exist; available fields: {', '.join(map(str, df.columns))}")
+        # Project before converting, so unused columns are never serialized.
+        df = df[columns]
+    records = _structured_rows(df, format)
+    markdown = format_series_search_results(df, total_count)
+    return CallToolResult(
+        content=[TextContent(type="text", text=markdown)],
+        structuredContent={"results": records}
+    )
 
 @mcp.tool()
-def get_series_info(series_id: str) -> CallToolResult:
+@_tool("getting series info")
+async def get_series_info(series_id: str) -> CallToolResult:
     """
     Get metadata for a specific data series.
     
     Args:
         series_id: The ID of the series (e.g., "GDP", "UNRATE").
     """
-    try:
-        fred = get_fred()
-        info = fred.get_series_info(series_id)
-        if info is None or info.empty:
-            msg = f"No info found for series {series_id}"
-            return CallToolResult(
-                content=[TextContent(type="text", text=msg)],
-                structuredContent={"error": msg}
-            )
-        
-        records = df_to_records(info)
-        markdown = f"## Series Metadata: {series_id}\n\n{info.to_markdown()}"
-        return CallToolResult(
-            content=[TextContent(type="text", text=markdown)],
-            structuredContent=records[0] if records else {}
-        )
-    except Exception as e:
-        error_msg = f"Error getting series info: {str(e)}"
+    fred = get_fred()
+    info = await asyncio.to_thread(fred.get_series_info, series_id)
+    if info is None or info.empty:
+        msg = f"No info found for series {series_id}"
         return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True,
-            structuredContent={"error": str(e)}
+            content=[TextContent(type="text", text=msg)],
+            structuredContent={"error": msg}
         )
+    
+    buf = io.StringIO()
+    buf.write(f"## Series Metadata: {series_id}\n\n")
+    markdown = _fast_to_markdown(info.rename_axis("field").rename("value"), index=True, buf=buf)
+    return CallToolResult(
+        content=[TextContent(type="text", text=markdown)],
+        structuredContent={str(field): value for field, value in info.items()}
+    )
 
 @mcp.tool()
-def get_series_data(series_id: str, limit: int = 1000, offset: int = 0, file_path: Optional[str] = None) -> CallToolResult:
+@_tool("getting series data")
+async def get_series_data(series_id: str, limit: int = 1000, offset: int = 0, file_path: Optional[str] = None, pretty: bool = False, format: str = "records") -> CallToolResult:
     """
     Get data points for a specific series.
     
     Args:
         series_id: The ID of the series (e.g., "GDP").
-        limit: Max data points to return in the markdown preview (default: 1000).
+        limit: Max data points to return (default: 1000); the markdown table shows at most the first 50.
         offset: Data points to skip (default: 0).
         file_path: Optional absolute path to save the full data as JSON. 
                    If provided, the full dataset (ignoring limit/offset) is saved and response is minimized.
+                   Use a `.csv`, `.jsonl`, `.parquet` or `.feather` extension to write that format instead.
+        pretty: Indent a saved JSON file for reading; it is written compactly by default.
+        format: Layout of the structured data: "records" (a list of {date, value} objects, default)
+                or "columnar" ({"date": [...], "value": [...]}, more compact for long series).
     """
-    try:
-        fred = get_fred()
-        # Get series data
-        data = fred.get_series(series_id)
-        
-        if data is None or data.empty:
-            msg = f"No data found for series {series_id}"
-            return CallToolResult(
-                content=[TextContent(type="text", text=msg)],
-                structuredContent={"error": msg}
-            )
-            
-        records = df_to_records(data)
-
-        # Handle file download if requested
-        if file_path:
-            msg = save_to_file(data, file_path, series_id)
-            return CallToolResult(
-                content=[TextContent(type="text", text=msg)],
-                structuredContent={"message": msg, "file_path": file_path, "count": len(records)}
-            )
-
-        # Prepare markdown preview
-        # Limit/Offset applies to the preview
-        total_points = len(data)
-        data_page = data.iloc[offset : offset + limit]
-        
-        # Try to get info for title
-        try:
-            info = fred.get_series_info(series_id)
-            title = info.get('title', series_id)
-            units = info.get('units', '')
-            header = f"## {title} ({units})"
-        except:
+    fred = get_fred()
+    # Get series data
+    fetch_data = asyncio.to_thread(fred.get_series, series_id)
+    if file_path:
+        data = await fetch_data
+    else:
+        # The preview also needs the series title; fetch it in parallel with the data.
+        data, header = await asyncio.gather(
+            fetch_data, asyncio.to_thread(_series_header, series_id), return_exceptions=True
+        )
+        if isinstance(data, Exception):
+            raise data
+        if isinstance(header, Exception):
             header = f"## {series_id}"
-
-        result_msg = f"{header}\n"
-        result_msg += f"**Showing {len(data_page)} of {total_points} data points**\n\n"
-        result_msg += data_page.to_markdown()
-        
+    
+    if data is None or data.empty:
+        msg = f"No data found for series {series_id}"
         return CallToolResult(
-            content=[TextContent(type="text", text=result_msg)],
-            structuredContent={"data": records[offset : offset + limit]}
+            content=[TextContent(type="text", text=msg)],
+            structuredContent={"error": msg}
         )
 
-    except Exception as e:
-        error_msg = f"Error getting series data: {str(e)}"
+    # Handle file download if requested; nothing below (records, markdown) is needed for it
+    if file_path:
+        msg, count = await asyncio.to_thread(save_to_file, data, file_path, series_id, pretty=pretty)
         return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True,
-            structuredContent={"error": str(e)}
+            content=[TextContent(type="text", text=msg)],
+            structuredContent={"message": msg, "file_path": file_path, "count": count}
         )
 
+    # Prepare markdown preview
+    # Limit/Offset applies to the preview; slice first so only shown rows are converted
+    total_points = len(data)
+    data_page = data.iloc[offset : offset + limit]
+    records = _structured_rows(data_page, format)
+
+    buf = io.StringIO()
+    buf.write(f"{header}\n**Showing {len(data_page)} of {total_points} data points**\n\n")
+    buf.write(_preview_cap_note(len(data_page)))
+    result_msg = _series_to_markdown(data_page.head(PREVIEW_ROW_CAP), buf=buf)
+    
+    return CallToolResult(
+        content=[TextContent(type="text", text=result_msg)],
+        structuredContent={"data": records}
+    )
+
 # --- Category Tools ---
 
 @mcp.tool()
+@_tool()
 def get_category_details(category_id: int) -> CallToolResult:
     """
     Get details for a specific category (if supported).
@@ -208,20 +522,14 @@ def get_category_details(category_id: int) -> CallToolResult:
     Args:
         category_id: The ID of the category (e.g., 125).
     """
-    try:
-        msg = f"To explore category {category_id}, please use `get_category_series` or `get_category_children`."
-        return CallToolResult(
-            content=[TextContent(type="text", text=msg)],
-            structuredContent={"message": msg, "category_id": category_id, "status": "not_implemented"}
-        )
-    except Exception as e:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Error: {str(e)}")],
-            isError=True,
-            structuredContent={"error": str(e)}
-        )
+    msg = f"To explore category {category_id}, please use `get_category_series` or `get_category_children`."
+    return CallToolResult(
+        content=[TextContent(type="text", text=msg)],
+        structuredContent={"message": msg, "category_id": category_id, "status": "not_implemented"}
+    )
 
 @mcp.tool()
+@_tool()
 def get_category_children(category_id: int) -> CallToolResult:
     """
     Get child categories for a specific category.
@@ -229,18 +537,11 @@ def get_category_children(category_id: int) -> CallToolResult:
     Args:
         category_id: The parent category ID.
     """
-    try:
-        msg = "Tool `get_category_children` is not currently available via this wrapper. Please use `get_category_series`."
-        return CallToolResult(
-            content=[TextContent(type="text", text=msg)],
-            structuredContent={"message": msg, "category_id": category_id, "status": "not_implemented"}
-        )
-    except Exception as e:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Error: {str(e)}")],
-            isError=True,
-            structuredContent={"error": str(e)}
-        )
+    msg = "Tool `get_category_children` is not currently available via this wrapper. Please use `get_category_series`."
+    return CallToolResult(
+        content=[TextContent(type="text", text=msg)],
+        structuredContent={"message": msg, "category_id": category_id, "status": "not_implemented"}
+    )
 
 
 # Re-implementing correctly based on `fredapi` capabilities (it's often just a thin wrapper).
@@ -252,7 +553,8 @@ def get_category_children(category_id: int) -> CallToolResult:
 # Let's stick to safe bets: `search_by_category` -> `get_category_series`.
 
 @mcp.tool()
-def get_category_series(category_id: int, limit: int = 1000, offset: int = 0, file_path: Optional[str] = None) -> CallToolResult:
+@_tool("getting category series")
+async def get_category_series(category_id: int, limit: int = 1000, offset: int = 0, file_path: Optional[str] = None, pretty: bool = False) -> CallToolResult:
     """
     Get series in a specific category.
     
@@ -261,35 +563,34 @@ def get_category_series(category_id: int, limit: int = 1000, offset: int = 0, fi
         limit: Max results in preview.
         offset: Offset for preview.
         file_path: Optional absolute path to save the full list as JSON.
+                   Use a `.csv`, `.jsonl`, `.parquet` or `.feather` extension to write that format instead.
+        pretty: Indent a saved JSON file for reading; it is written compactly by default.
     """
-    try:
-        fred = get_fred()
-        df = fred.search_by_category(category_id, limit=limit, order_by='popularity', sort_order='desc')
-        
-        records = df_to_records(df)
-
-        if file_path:
-            msg = save_to_file(df, file_path, f"category_{category_id}")
-            return CallToolResult(
-                content=[TextContent(type="text", text=msg)],
-                structuredContent={"message": msg, "file_path": file_path, "count": len(records)}
-            )
-            
-        markdown = format_series_search_results(df, limit, offset)
-        return CallToolResult(
-            content=[TextContent(type="text", text=markdown)],
-            structuredContent={"results": records}
+    fred = get_fred()
+    if file_path:
+        df = await asyncio.to_thread(
+            fred.search_by_category, category_id, order_by='popularity', sort_order='desc'
         )
-    except Exception as e:
-        error_msg = f"Error getting category series: {str(e)}"
+        msg, count = await asyncio.to_thread(save_to_file, df, file_path, f"category_{category_id}", pretty=pretty)
         return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True,
-            structuredContent={"error": str(e)}
+            content=[TextContent(type="text", text=msg)],
+            structuredContent={"message": msg, "file_path": file_path, "count": count}
         )
+        
+    # Only the requested page is downloaded and parsed
+    df, total_count = await asyncio.to_thread(
+        fred.category_series_page, category_id, limit=limit, offset=offset, order_by='popularity', sort_order='desc'
+    )
+    records = df_to_records(df)
+    markdown = format_series_search_results(df, total_count)
+    return CallToolResult(
+        content=[TextContent(type="text", text=markdown)],
+        structuredContent={"results": records}
+    )
 
 @mcp.tool()
-def get_releases(limit: int = 1000, offset: int = 0, file_path: Optional[str] = None) -> CallToolResult:
+@_tool("getting releases")
+async def get_releases(limit: int = 1000, offset: int = 0, file_path: Optional[str] = None, pretty: bool = False) -> CallToolResult:
     """
     Get all releases of economic data.
     
@@ -297,35 +598,32 @@ def get_releases(limit: int = 1000, offset: int = 0, file_path: Optional[str] =
         limit: Max results in preview.
         offset: Offset for preview.
         file_path: Optional absolute path to save the full list as JSON.
+                   Use a `.csv`, `.jsonl`, `.parquet` or `.feather` extension to write that format instead.
+        pretty: Indent a saved JSON file for reading; it is written compactly by default.
     """
-    try:
-        fred = get_fred()
-        df = fred.get_releases(limit=limit, offset=offset)
-        
-        records = df_to_records(df)
-
-        if file_path:
-            msg = save_to_file(df, file_path, "releases")
-            return CallToolResult(
-                content=[TextContent(type="text", text=msg)],
-                structuredContent={"message": msg, "file_path": file_path, "count": len(records)}
-            )
-            
-        markdown = format_series_search_results(df, limit, offset)
-        return CallToolResult(
-            content=[TextContent(type="text", text=markdown)],
-            structuredContent={"results": records}
-        )
-    except Exception as e:
-        error_msg = f"Error getting releases: {str(e)}"
+    fred = get_fred()
+    if file_path:
+        # The export ignores limit/offset and pages through the whole list.
+        df = await asyncio.to_thread(fred.get_all_releases)
+        msg, count = await asyncio.to_thread(save_to_file, df, file_path, "releases", pretty=pretty)
         return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True,
-            structuredContent={"error": str(e)}
+            content=[TextContent(type="text", text=msg)],
+            structuredContent={"message": msg, "file_path": file_path, "count": count}
         )
 
+    df, total_count = await asyncio.to_thread(fred.releases_page, limit=limit, offset=offset)
+    records = df_to_records(df)
+        
+    # FRED already applied limit/offset, so `df` is the page.
+    markdown = format_series_search_results(df, total_count, noun="releases")
+    return CallToolResult(
+        content=[TextContent(type="text", text=markdown)],
+        structuredContent={"results": records}
+    )
+
 @mcp.tool()
-def get_release_series(release_id: int, limit: int = 1000, offset: int = 0, file_path: Optional[str] = None) -> CallToolResult:
+@_tool("getting release series")
+async def get_release_series(release_id: int, limit: int = 1000, offset: int = 0, file_path: Optional[str] = None, pretty: bool = False) -> CallToolResult:
     """
     Get series in a specific release.
     
@@ -334,92 +632,83 @@ def get_release_series(release_id: int, limit: int = 1000, offset: int = 0, file
         limit: Max results in preview.
         offset: Offset for preview.
         file_path: Optional absolute path to save the full list as JSON.
+                   Use a `.csv`, `.jsonl`, `.parquet` or `.feather` extension to write that format instead.
+        pretty: Indent a saved JSON file for reading; it is written compactly by default.
     """
-    try:
-        fred = get_fred()
-        df = fred.get_release_series(release_id, limit=limit, offset=offset)
-        
-        records = df_to_records(df)
-
-        if file_path:
-            msg = save_to_file(df, file_path, f"release_{release_id}")
-            return CallToolResult(
-                content=[TextContent(type="text", text=msg)],
-                structuredContent={"message": msg, "file_path": file_path, "count": len(records)}
-            )
-            
-        markdown = format_series_search_results(df, limit, offset)
+    fred = get_fred()
+    if file_path:
+        # The export ignores limit/offset and pages through the whole list.
+        df = await asyncio.to_thread(fred.get_all_release_series, release_id)
+        msg, count = await asyncio.to_thread(save_to_file, df, file_path, f"release_{release_id}", pretty=pretty)
         return CallToolResult(
-            content=[TextContent(type="text", text=markdown)],
-            structuredContent={"results": records}
-        )
-    except Exception as e:
-        error_msg = f"Error getting release series: {str(e)}"
-        return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True,
-            structuredContent={"error": str(e)}
+            content=[TextContent(type="text", text=msg)],
+            structuredContent={"message": msg, "file_path": file_path, "count": count}
         )
 
+    df, total_count = await asyncio.to_thread(fred.release_series_page, release_id, limit=limit, offset=offset)
+    records = df_to_records(df)
+        
+    # FRED already applied limit/offset, so `df` is the page.
+    markdown = format_series_search_results(df, total_count)
+    return CallToolResult(
+        content=[TextContent(type="text", text=markdown)],
+        structuredContent={"results": records}
+    )
+
 # Sources and Tags
 @mcp.tool()
-def get_sources(file_path: Optional[str] = None) -> CallToolResult:
+@_tool("getting sources")
+async def get_sources(file_path: Optional[str] = None, pretty: bool = False) -> CallToolResult:
     """
     Get all sources of economic data.
     
     Args:
         file_path: Optional absolute path to save the sources list as JSON.
+                   Use a `.csv`, `.jsonl`, `.parquet` or `.feather` extension to write that format instead.
+        pretty: Indent a saved JSON file for reading; it is written compactly by default.
     """
-    try:
-        fred = get_fred()
-        df = fred.get_sources()
-        
-        records = df_to_records(df)
-
-        if file_path:
-            msg = save_to_file(df, file_path, "sources")
-            return CallToolResult(
-                content=[TextContent(type="text", text=msg)],
-                structuredContent={"message": msg, "file_path": file_path, "count": len(records)}
-            )
-            
-        markdown = f"**Found {len(df)} sources:**\n\n"
-        markdown += df.to_markdown(index=False)
-        return CallToolResult(
-            content=[TextContent(type="text", text=markdown)],
-            structuredContent={"results": records}
-        )
-    except Exception as e:
-        error_msg = f"Error getting sources: {str(e)}"
+    fred = get_fred()
+    df = await asyncio.to_thread(fred.get_sources)
+    
+    if file_path:
+        msg, count = await asyncio.to_thread(save_to_file, df, file_path, "sources", pretty=pretty)
         return CallToolResult(
-            content=[TextContent(type="text", text=error_msg)],
-            isError=True,
-            structuredContent={"error": str(e)}
+            content=[TextContent(type="text", text=msg)],
+            structuredContent={"message": msg, "file_path": file_path, "count": count}
         )
 
+    records = df_to_records(df)
+        
+    buf = io.StringIO()
+    buf.write(f"**Found {len(df)} sources:**\n\n")
+    buf.write(_preview_cap_note(len(df)))
+    markdown = _fast_to_markdown(df.head(PREVIEW_ROW_CAP), buf=buf)
+    return CallToolResult(
+        content=[TextContent(type="text", text=markdown)],
+        structuredContent={"results": records}
+    )
+
 @mcp.tool()
-def get_source(source_id: int) -> CallToolResult:
+@_tool("getting source")
+async def get_source(source_id: int) -> CallToolResult:
     """Get details for a specific source."""
-    try:
-        fred = get_fred()
-        info = fred.get_source(source_id)
-        if isinstance(info, list) and len(info) > 0:
-            info = info[0] # usage pattern might vary
-        # `get_source` in fredapi might return dict or list
-        msg = f"## Source {source_id}\n\n{info}"
-        return CallToolResult(
-            content=[TextContent(type="text", text=msg)],
-            structuredContent=info if isinstance(info, dict) else {"details": str(info)}
-        )
-    except Exception as e:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Error getting source: {str(e)}")],
-            isError=True,
-            structuredContent={"error": str(e)}
-        )
+    import orjson
+
+    fred = get_fred()
+    info = await asyncio.to_thread(fred.get_source, source_id)
+    if isinstance(info, list) and len(info) > 0:
+        info = info[0] # usage pattern might vary
+    # Render as real JSON; the dict's repr is neither valid JSON nor Markdown-friendly
+    details = orjson.dumps(info, option=orjson.OPT_INDENT_2, default=str).decode()
+    msg = f"## Source {source_id}\n\n```json\n{details}\n```"
+    return CallToolResult(
+        content=[TextContent(type="text", text=msg)],
+        structuredContent=info if isinstance(info, dict) else {"details": str(info)}
+    )
 
 # Tags
 @mcp.tool()
+@_tool()
 def search_related_tags(tag_names: str, limit: int = 1000, offset: int = 0) -> CallToolResult:
     """
     Get related tags for a set of tags.
@@ -429,18 +718,11 @@ def search_related_tags(tag_names: str, limit: int = 1000, offset: int = 0) -> C
         limit: Max results.
         offset: Offset.
     """
-    try:
-        msg = "Tool `search_related_tags` is not fully implemented in this version."
-        return CallToolResult(
-            content=[TextContent(type="text", text=msg)],
-            structuredContent={"message": msg, "tag_names": tag_names, "status": "not_implemented"}
-        )
-    except Exception as e:
-        return CallToolResult(
-            content=[TextContent(type="text", text=f"Error: {str(e)}")],
-            isError=True,
-            structuredContent={"error": str(e)}
-        )
+    msg = "Tool `search_related_tags` is not fully implemented in this version."
+    return CallToolResult(
+        content=[TextContent(type="text", text=msg)],
+        structuredContent={"message": msg, "tag_names": tag_names, "status": "not_implemented"}
+    )
 
 def main():
     mcp.run()
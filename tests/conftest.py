@@ -0,0 +1,48 @@
+import pytest
+
+from fred_mcp import cache
+from fred_mcp.client import PooledFred
+
+
+class FakeResponse:
+    def __init__(self, body: str, status: int = 200):
+        self.content = body.encode()
+        self.status_code = status
+        self.ok = status < 400
+
+    def raise_for_status(self):
+        if not self.ok:
+            raise OSError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Stands in for `requests.Session`: serves canned bodies by URL substring and records every URL."""
+
+    def __init__(self, routes: dict):
+        self.routes = routes
+        self.calls = []
+        self.proxies = {}
+
+    def get(self, url, timeout=None):
+        self.calls.append(url)
+        for fragment, body in self.routes.items():
+            if fragment in url:
+                return FakeResponse(*body) if isinstance(body, tuple) else FakeResponse(body)
+        return FakeResponse('<error code="404" message="Not Found"/>', 404)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Give each test its own empty disk and memory cache."""
+    monkeypatch.setattr(cache, "_cache", cache.FileCache(str(tmp_path / "cache")))
+    monkeypatch.setattr(cache, "_memory", cache.MemoryCache())
+
+
+@pytest.fixture
+def make_fred():
+    """Build a `PooledFred` whose session serves `routes`."""
+    def factory(routes: dict) -> PooledFred:
+        fred = PooledFred(api_key="x" * 32)
+        fred.session = FakeSession(routes)
+        return fred
+    return factory
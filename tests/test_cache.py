@@ -0,0 +1,128 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from fredapi import Fred
+
+from fred_mcp import cache
+from fred_mcp.cache import FileCache, MemoryCache, cached
+
+OBSERVATIONS = [("2020-01-01", "101.5"), ("2020-02-01", "."), ("2020-03-01", "0.000123456789012")]
+OBS_XML = '<observations count="3">' + ''.join(
+    f'<observation realtime_start="2024-01-01" realtime_end="2024-01-01" date="{d}" value="{v}"/>'
+    for d, v in OBSERVATIONS
+) + '</observations>'
+OBS_JSON = '{"count": 3, "observations": [' + ', '.join(
+    f'{{"realtime_start": "2024-01-01", "realtime_end": "2024-01-01", "date": "{d}", "value": "{v}"}}'
+    for d, v in OBSERVATIONS
+) + ']}'
+
+
+class Unloadable:
+    """Pickles fine but fails to unpickle, like a frame that needs a module missing at load time."""
+
+    def __reduce__(self):
+        return (__import__, ("fred_mcp_no_such_module",))
+
+
+def test_file_cache_round_trip(tmp_path):
+    store = FileCache(str(tmp_path))
+    store.set("series/abc", {"x": 1}, ttl=60)
+
+    value, expires_at = store.get_entry("series/abc")
+
+    assert value == {"x": 1}
+    assert expires_at > time.time()
+
+
+def test_file_cache_removes_expired_entries(tmp_path):
+    store = FileCache(str(tmp_path))
+    store.set("series/abc", {"x": 1}, ttl=-1)
+
+    assert store.get_entry("series/abc") is None
+    assert os.listdir(tmp_path / "series") == []
+
+
+@pytest.mark.parametrize("corrupt", ["pickle", "meta"])
+def test_file_cache_removes_unreadable_entries(tmp_path, corrupt):
+    store = FileCache(str(tmp_path))
+    if corrupt == "pickle":
+        store.set("series/abc", Unloadable(), ttl=60)
+    else:
+        store.set("series/abc", {"x": 1}, ttl=60)
+        (tmp_path / "series" / "abc.meta.json").write_text("{not json")
+
+    assert store.get_entry("series/abc") is None
+    assert os.listdir(tmp_path / "series") == []
+
+
+def test_memory_cache_evicts_least_recently_used():
+    store = MemoryCache(maxsize=2)
+    expires_at = time.time() + 60
+    store.set("a", 1, expires_at)
+    store.set("b", 2, expires_at)
+    store.get("a")
+    store.set("c", 3, expires_at)
+
+    assert store.get("a") == 1
+    assert store.get("b") is None
+    assert store.get("c") == 3
+
+
+def test_memory_cache_drops_expired_entries():
+    store = MemoryCache()
+    store.set("a", 1, time.time() - 1)
+
+    assert store.get("a") is None
+
+
+class Counter:
+    def __init__(self):
+        self.calls = 0
+
+    @cached(ttl_days=1)
+    def fetch(self, name, limit=10):
+        self.calls += 1
+        return f"{name}:{limit}"
+
+
+def test_cached_serves_repeat_calls_from_memory_then_disk():
+    counter = Counter()
+
+    assert counter.fetch("gdp") == "gdp:10"
+    assert counter.fetch("gdp", limit=10) == "gdp:10"
+    cache._memory._entries.clear()
+    assert counter.fetch(name="gdp") == "gdp:10"
+
+    assert counter.calls == 1
+
+
+def test_cached_calls_through_when_caching_is_off(monkeypatch):
+    monkeypatch.setattr(cache, "_cache", None)
+    counter = Counter()
+
+    counter.fetch("gdp")
+    counter.fetch("gdp")
+
+    assert counter.calls == 2
+
+
+def test_empty_cache_dir_turns_caching_off(monkeypatch):
+    monkeypatch.setenv("FRED_MCP_CACHE_DIR", "")
+    assert cache.default_cache_dir() is None
+
+    monkeypatch.delenv("FRED_MCP_CACHE_DIR")
+    assert cache.default_cache_dir().endswith(os.path.join(".cache", "fred-mcp"))
+
+
+def test_json_get_series_matches_fredapi(make_fred):
+    fred = make_fred({"file_type=json": OBS_JSON, "/series/observations?": OBS_XML})
+
+    expected = Fred.get_series(fred, "GDP")
+    actual = fred.get_series("GDP")
+
+    pd.testing.assert_series_equal(actual, expected)
+    assert np.isnan(actual.iloc[1])
+    assert "file_type=json" in fred.session.calls[-1]
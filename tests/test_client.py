@@ -0,0 +1,60 @@
+import pytest
+from fredapi import Fred
+
+INFO = (
+    '<seriess><series id="GDP" title="Gross Domestic Product" units="Billions of Dollars" '
+    'frequency_short="Q"/></seriess>'
+)
+SEARCH = (
+    '<seriess count="25">'
+    '<series id="S0" realtime_start="2024-01-01" realtime_end="2024-01-01" title="Series 0" '
+    'observation_start="1947-01-01" observation_end="2024-01-01" frequency="Quarterly" '
+    'frequency_short="Q" units="Units" units_short="U" seasonal_adjustment="SA" '
+    'seasonal_adjustment_short="SA" last_updated="2024-01-01 07:56:01-06" popularity="90" notes="n"/>'
+    '</seriess>'
+)
+
+
+def test_fredapi_private_hooks_exist():
+    # PooledFred overrides/calls these name-mangled fredapi internals; if fredapi
+    # renames them the pooled session would be silently bypassed.
+    assert callable(getattr(Fred, "_Fred__fetch_data", None))
+    assert callable(getattr(Fred, "_Fred__do_series_search", None))
+
+
+def test_fredapi_methods_fetch_through_pooled_session(make_fred):
+    fred = make_fred({"/series?": INFO})
+
+    info = fred.get_series_info("GDP")
+
+    assert info["title"] == "Gross Domestic Product"
+    assert len(fred.session.calls) == 1
+    assert fred.session.calls[0].endswith("&api_key=" + "x" * 32)
+
+
+def test_search_page_requests_only_the_page(make_fred):
+    fred = make_fred({"/series/search?": SEARCH})
+
+    df, total = fred.search_page("gdp", limit=1, offset=5)
+
+    assert total == 25
+    assert list(df["id"]) == ["S0"]
+    assert "&limit=1&offset=5" in fred.session.calls[0]
+
+
+def test_error_response_raises_fred_message(make_fred):
+    fred = make_fred({"/series?": ('<error code="400" message="Bad Request.  No series."/>', 400)})
+
+    with pytest.raises(ValueError, match="No series"):
+        fred.get_series_info("NOPE")
+
+
+def test_releases_page_reports_fred_total(make_fred):
+    body = '<releases count="2300">' + ''.join(f'<release id="{i}" name="Release {i}"/>' for i in range(5)) + '</releases>'
+    fred = make_fred({"/releases?": body})
+
+    df, total = fred.releases_page(limit=5, offset=10)
+
+    assert total == 2300
+    assert list(df["id"]) == ["0", "1", "2", "3", "4"]
+    assert "limit=5&offset=10" in fred.session.calls[0]
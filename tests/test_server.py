@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+
+from fred_mcp.server import df_to_columns, df_to_records
+
+
+def test_records_and_columnar_layouts_encode_values_alike():
+    df = pd.DataFrame({
+        "id": ["A", "B"],
+        "observation_start": pd.to_datetime(["1947-01-01", "2000-06-01"]),
+        "popularity": [1.5, np.nan],
+    })
+
+    records = df_to_records(df)
+    columns = df_to_columns(df)
+
+    assert records == [
+        {"id": "A", "observation_start": "1947-01-01", "popularity": 1.5},
+        {"id": "B", "observation_start": "2000-06-01", "popularity": None},
+    ]
+    assert columns == {name: [row[name] for row in records] for name in records[0]}
+
+
+def test_series_records_and_columns_use_null_for_missing():
+    series = pd.Series([1.0, np.nan], index=pd.to_datetime(["2020-01-01", "2020-02-01"]))
+
+    assert df_to_records(series) == [{"date": "2020-01-01", "value": 1.0}, {"date": "2020-02-01", "value": None}]
+    assert df_to_columns(series) == {"date": ["2020-01-01", "2020-02-01"], "value": [1.0, None]}